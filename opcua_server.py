@@ -9,7 +9,7 @@ Requirements:
     pip3 install asyncua
     pip3 install adafruit-circuitpython-dht
     pip3 install adafruit-circuitpython-ina219
-    pip3 install RPi.GPIO
+    pip3 install lgpio
 
 OPC UA Server Details:
     Endpoint: opc.tcp://0.0.0.0:4840/freeopcua/server/
@@ -21,7 +21,7 @@ Connect with UAExpert or any OPC UA client to view live sensor data
 import asyncio
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 
 # OPC UA imports
 try:
@@ -32,19 +32,43 @@ except ImportError:
     print("Install with: pip3 install asyncua")
     sys.exit(1)
 
+# OPC UA PubSub ships with asyncua >= 2.0; the server falls back to
+# plain client/server if this installation doesn't provide it
+try:
+    from asyncua import pubsub
+except ImportError:
+    pubsub = None
+
+# uvloop's libuv-based event loop roughly halves per-callback overhead
+# on the asyncua socket path; fall back to stock asyncio if missing
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Numba JIT-compiles the per-cycle unit conversions to a single native
+# call; optional - the pure-Python fallback is identical in behavior
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Sensor imports
 try:
     import board
     import adafruit_dht
     from adafruit_ina219 import INA219
     import busio
-    import RPi.GPIO as GPIO
+    import lgpio
 except ImportError as e:
     print(f"Error: Missing sensor library - {e}")
-    print("Install with: pip3 install adafruit-circuitpython-dht adafruit-circuitpython-ina219 RPi.GPIO")
+    print("Install with: pip3 install adafruit-circuitpython-dht adafruit-circuitpython-ina219 lgpio")
     sys.exit(1)
 
+import statistics
+import threading
 import time
+from dataclasses import astuple, dataclass, fields
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -54,15 +78,84 @@ _logger = logging.getLogger('opcua.server')
 DHT_PIN = board.D4          # DHT11 data pin (GPIO 4)
 TRIG_PIN = 23               # HC-SR04 trigger pin
 ECHO_PIN = 24               # HC-SR04 echo pin
+ULTRASONIC_SAMPLES = 3      # Pings per reading; median filters outliers
 
 # Server Configuration
 SERVER_ENDPOINT = "opc.tcp://0.0.0.0:4840/freeopcua/server/"
 SERVER_NAME = "Industrial IoT Sensor Server"
 NAMESPACE_URI = "http://iot.stonybrook.edu"
 
-# Update interval (seconds)
+# Update interval (seconds) - maximum time between publishes; a flagged
+# sensor change wakes the publisher earlier
 UPDATE_INTERVAL = 2.0
 
+# Sensor poll interval (seconds) - the background reader runs faster
+# than the publish interval so changes surface with low latency
+SENSOR_POLL_INTERVAL = 0.5
+
+# Minimum movement per variable before a new reading counts as changed;
+# keys not listed (status codes) trigger on any change
+DEADBAND = {
+    'temp': 0.1,        # °C
+    'temp_f': 0.18,     # °F (matches 0.1 °C)
+    'humidity': 0.5,    # %RH
+    'voltage': 0.01,    # V
+    'current': 0.005,   # A
+    'power': 0.01,      # W
+    'distance': 0.5,    # cm
+    'distance_in': 0.2, # inches (matches 0.5 cm)
+}
+
+# Variables published every cycle even when unchanged
+ALWAYS_WRITE = ('timestamp', 'uptime')
+
+
+@dataclass(slots=True)
+class SensorSnapshot:
+    """One poll cycle's sensor values
+
+    Field order matches the server's write plan, so the publisher can
+    zip astuple(snapshot) straight onto the pre-bound node list. Slots
+    keep per-field storage flat instead of paying a dict per snapshot.
+    """
+    temp: float = 0.0
+    temp_f: float = 0.0
+    humidity: float = 0.0
+    dht_status: int = 2
+    voltage: float = 0.0
+    current: float = 0.0
+    power: float = 0.0
+    ina_status: int = 2
+    distance: float = 0.0
+    distance_in: float = 0.0
+    ultrasonic_status: int = 2
+
+
+SNAPSHOT_FIELDS = tuple(f.name for f in fields(SensorSnapshot))
+
+
+def _derive(temp_c, distance_cm):
+    """Derived values for one snapshot: (temp_f, distance_in)
+
+    Kept as a free function over plain floats so Numba can compile it;
+    at kHz-class update rates the JITted call replaces several boxed
+    float operations per cycle.
+    """
+    return temp_c * 1.8 + 32.0, distance_cm * 0.3937007874
+
+
+if njit is not None:
+    _derive = njit(cache=True)(_derive)
+
+# PubSub Configuration - one UDP multicast NetworkMessage per interval
+# fans out all sensor values without per-client subscription traffic
+PUBSUB_ENABLED = True
+PUBSUB_URL = "opc.udp://239.0.0.1:4840"
+PUBSUB_PUBLISHER_ID = 1
+PUBSUB_DATASET_NAME = "SensorData"
+PUBSUB_WRITER_GROUP_ID = 1
+PUBSUB_DATASET_WRITER_ID = 32
+
 
 class SensorReader:
     """Class to handle all sensor reading operations"""
@@ -78,6 +171,9 @@ class SensorReader:
         except Exception as e:
             _logger.error(f"✗ DHT11 initialization failed: {e}")
             self.dht_sensor = None
+        # Last good (temperature, humidity), re-published on transient
+        # read failures so clients never see a spurious drop to 0
+        self._dht_last = (0.0, 0.0)
         
         # Initialize INA219
         try:
@@ -88,13 +184,19 @@ class SensorReader:
             _logger.error(f"✗ INA219 initialization failed: {e}")
             self.ina219 = None
         
-        # Initialize HC-SR04
+        # Initialize HC-SR04 (lgpio: echo edges come through the kernel's
+        # /dev/gpiochip event interface with nanosecond timestamps, so
+        # pulse width is not distorted by interpreter jitter)
         try:
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setwarnings(False)
-            GPIO.setup(TRIG_PIN, GPIO.OUT)
-            GPIO.setup(ECHO_PIN, GPIO.IN)
-            GPIO.output(TRIG_PIN, False)
+            self.gpio_handle = lgpio.gpiochip_open(0)
+            lgpio.gpio_claim_output(self.gpio_handle, TRIG_PIN, 0)
+            lgpio.gpio_claim_alert(self.gpio_handle, ECHO_PIN, lgpio.BOTH_EDGES)
+            self._echo_rise_ns = None
+            self._echo_pulse_us = None
+            self._echo_done = threading.Event()
+            self._echo_cb = lgpio.callback(
+                self.gpio_handle, ECHO_PIN, lgpio.BOTH_EDGES, self._on_echo_edge
+            )
             time.sleep(0.5)  # Let sensor settle
             _logger.info("✓ HC-SR04 initialized")
             self.ultrasonic_enabled = True
@@ -113,15 +215,18 @@ class SensorReader:
         try:
             temperature_c = self.dht_sensor.temperature
             humidity = self.dht_sensor.humidity
-            
+
             if temperature_c is not None and humidity is not None:
-                return float(temperature_c), float(humidity), 0  # Status 0 = OK
+                self._dht_last = (float(temperature_c), float(humidity))
+                return (*self._dht_last, 0)  # Status 0 = OK
             else:
-                return 0.0, 0.0, 1  # Status 1 = Read error
-                
+                return (*self._dht_last, 1)  # Status 1 = Read error
+
         except RuntimeError:
-            # DHT11 timeout - common, not critical
-            return 0.0, 0.0, 1
+            # DHT11 timeout - common, not critical; keep the last good
+            # reading so historians don't record a spike to 0 °C while
+            # the status code still flags the failed read
+            return (*self._dht_last, 1)
         except Exception as e:
             _logger.error(f"DHT11 error: {e}")
             return 0.0, 0.0, 2
@@ -145,56 +250,72 @@ class SensorReader:
             _logger.error(f"INA219 error: {e}")
             return 0.0, 0.0, 0.0, 2
     
+    def _on_echo_edge(self, chip, gpio, level, timestamp):
+        """lgpio alert callback - timestamp is a kernel-captured
+        nanosecond tick, not taken by the Python interpreter"""
+        if level == 1:
+            self._echo_rise_ns = timestamp
+        elif self._echo_rise_ns is not None:
+            self._echo_pulse_us = (timestamp - self._echo_rise_ns) / 1000.0
+            self._echo_done.set()
+
     def read_ultrasonic(self):
         """
         Read distance from HC-SR04 ultrasonic sensor
         Returns: (distance_cm, status_code)
+
+        Fires ULTRASONIC_SAMPLES pings and takes the median pulse width,
+        so a single outlier echo (vibration, air current, stray
+        reflection) is not committed to the bus with status OK. The
+        extra pings run entirely in the caller's worker thread and the
+        edges are still kernel-timestamped, so the event loop sees no
+        added latency.
         """
         if not self.ultrasonic_enabled:
             return 0.0, 2  # Status 2 = Sensor error
-        
+
         try:
-            # Send trigger pulse
-            GPIO.output(TRIG_PIN, True)
-            time.sleep(0.00001)  # 10 microseconds
-            GPIO.output(TRIG_PIN, False)
-            
-            # Measure echo pulse duration with timeout
-            timeout_start = time.time()
-            pulse_start = timeout_start
-            
-            while GPIO.input(ECHO_PIN) == 0:
-                pulse_start = time.time()
-                if pulse_start - timeout_start > 0.1:  # 100ms timeout
-                    return 0.0, 1  # Status 1 = Timeout
-            
-            pulse_end = pulse_start
-            while GPIO.input(ECHO_PIN) == 1:
-                pulse_end = time.time()
-                if pulse_end - pulse_start > 0.1:
-                    return 0.0, 1
-            
+            pulses = []
+            for i in range(ULTRASONIC_SAMPLES):
+                if i:
+                    time.sleep(0.03)  # Let residual echoes fade between pings
+
+                # Arm the edge callback and send the trigger pulse
+                self._echo_rise_ns = None
+                self._echo_pulse_us = None
+                self._echo_done.clear()
+                lgpio.gpio_write(self.gpio_handle, TRIG_PIN, 1)
+                time.sleep(0.00001)  # 10 microseconds
+                lgpio.gpio_write(self.gpio_handle, TRIG_PIN, 0)
+
+                # Wait for the falling-edge callback (100ms timeout)
+                if self._echo_done.wait(0.1):
+                    pulses.append(self._echo_pulse_us)
+
+            if not pulses:
+                return 0.0, 1  # Status 1 = Timeout
+
             # Calculate distance (speed of sound = 343 m/s)
-            pulse_duration = pulse_end - pulse_start
-            distance = pulse_duration * 17150  # (343m/s * 100cm/m) / 2
+            distance = statistics.median(pulses) * 0.01715  # (343m/s * 100cm/m) / 2, in us
             distance = round(distance, 2)
-            
+
             # Validate reading (sensor range: 2-400cm)
             if 2 <= distance <= 400:
                 return float(distance), 0  # Status 0 = OK
             else:
                 return 0.0, 3  # Status 3 = Out of range
-                
+
         except Exception as e:
             _logger.error(f"HC-SR04 error: {e}")
             return 0.0, 2
-    
+
     def cleanup(self):
         """Clean up GPIO resources"""
         if self.dht_sensor:
             self.dht_sensor.exit()
         if self.ultrasonic_enabled:
-            GPIO.cleanup()
+            self._echo_cb.cancel()
+            lgpio.gpiochip_close(self.gpio_handle)
 
 
 class OPCUAServer:
@@ -204,6 +325,16 @@ class OPCUAServer:
         self.server = None
         self.sensor_reader = SensorReader()
         self.nodes = {}
+        # Latest sensor snapshot from the background poll task, plus the
+        # snapshot last flagged as changed and the publisher wakeup event
+        self._latest = None
+        self._last_flagged = None
+        self._change_event = asyncio.Event()
+        # Last value actually written per variable, for write deduplication
+        self._last_written = {}
+        # True once init_pubsub() configured the PubSub model; run()
+        # then starts it alongside the server
+        self._pubsub_ready = False
         
     async def init_server(self):
         """Initialize OPC UA server and create address space"""
@@ -276,8 +407,10 @@ class OPCUAServer:
         
         # Create system status object
         system_obj = await sensor_folder.add_object(idx, "SystemInfo")
+        # OPC UA DateTime serializes as an 8-byte FILETIME on the wire,
+        # so clients get a native timestamp instead of parsing a string
         self.nodes['timestamp'] = await system_obj.add_variable(
-            idx, "LastUpdate", ""
+            idx, "LastUpdate", datetime.now(timezone.utc)
         )
         self.nodes['uptime'] = await system_obj.add_variable(
             idx, "Uptime_seconds", 0.0
@@ -286,53 +419,220 @@ class OPCUAServer:
         # Make all variables writable for testing purposes
         for node in self.nodes.values():
             await node.set_writable()
+
+        # Fixed write order for the batched update in update_values()
+        self._write_order = SNAPSHOT_FIELDS + ('timestamp', 'uptime')
+
+        # Variant type per variable, cached so update_values() can build
+        # each ua.Variant directly instead of re-probing the Python type
+        # through Variant's inference on every write
+        self._variant_types = {
+            'temp': ua.VariantType.Double,
+            'temp_f': ua.VariantType.Double,
+            'humidity': ua.VariantType.Double,
+            'dht_status': ua.VariantType.Int64,
+            'voltage': ua.VariantType.Double,
+            'current': ua.VariantType.Double,
+            'power': ua.VariantType.Double,
+            'ina_status': ua.VariantType.Int64,
+            'distance': ua.VariantType.Double,
+            'distance_in': ua.VariantType.Double,
+            'ultrasonic_status': ua.VariantType.Int64,
+            'timestamp': ua.VariantType.DateTime,
+            'uptime': ua.VariantType.Double,
+        }
+        # Pre-bound (key, nodeid, variant type) triples - the update loop
+        # just zips this against the value tuple, with no per-cycle dict
+        # subscripts or attribute loads left on the hot path
+        self._write_plan = tuple(
+            (key, self.nodes[key].nodeid, self._variant_types[key])
+            for key in self._write_order
+        )
         
         _logger.info("✓ OPC UA address space created")
         _logger.info(f"  - DHT11 variables: Temperature_C, Temperature_F, Humidity_Percent")
         _logger.info(f"  - INA219 variables: Voltage_V, Current_A, Power_W")
         _logger.info(f"  - HC-SR04 variables: Distance_cm, Distance_inches")
-        
+
+        await self.init_pubsub()
+
         return idx
+
+    async def init_pubsub(self):
+        """Configure OPC UA PubSub publishing of the sensor variables
+
+        Each publish interval broadcasts one UDP multicast NetworkMessage
+        carrying all variables, so telemetry fan-out no longer costs a
+        change notification per variable per subscribed client. The
+        client/server address space stays available for UAExpert.
+        """
+        if pubsub is None or not PUBSUB_ENABLED:
+            _logger.info("OPC UA PubSub unavailable - client/server mode only")
+            return
+
+        try:
+            dataset = await pubsub.PublishedDataItems.Create(
+                PUBSUB_DATASET_NAME,
+                self.server,
+                [
+                    pubsub.TargetVariable(
+                        Name=key, SourceNode=self.nodes[key].nodeid
+                    )
+                    for key in self._write_order
+                ],
+            )
+            writer = pubsub.DataSetWriter.new_uadp(
+                name="SensorDataWriter",
+                dataset_writer_id=ua.UInt16(PUBSUB_DATASET_WRITER_ID),
+                dataset_name=PUBSUB_DATASET_NAME,
+                datavalue=True,
+            )
+            writer_group = pubsub.WriterGroup.new_uadp(
+                name="SensorWriterGroup",
+                writer_group_id=ua.UInt16(PUBSUB_WRITER_GROUP_ID),
+                publishing_interval=UPDATE_INTERVAL * 1000.0,
+                writer=[writer],
+            )
+            connection = pubsub.PubSubConnection.udp_uadp(
+                "SensorDataConnection",
+                ua.UInt16(PUBSUB_PUBLISHER_ID),
+                pubsub.UdpSettings(Url=PUBSUB_URL),
+            )
+            await connection.add_writer_group(writer_group)
+
+            ps = await self.server.get_pubsub()
+            await ps.add_published_dataset(dataset)
+            await ps.add_connection(connection)
+
+            self._pubsub_ready = True
+            _logger.info(f"✓ OPC UA PubSub configured for {PUBSUB_URL}")
+        except Exception as e:
+            _logger.error(f"✗ PubSub setup failed, client/server mode only: {e}",
+                          exc_info=True)
     
+    async def _poll_sensors(self):
+        """Background task: read sensors and flag significant changes
+
+        All three reads block on hardware I/O (up to ~100ms for an
+        ultrasonic timeout), so they run concurrently in worker threads
+        to keep the event loop servicing OPC UA requests. The publisher
+        is woken via self._change_event only when a value moved by more
+        than its deadband, so steady-state cycles cost nothing.
+        """
+        while True:
+            dht_reading, ina_reading, ultrasonic_reading = await asyncio.gather(
+                asyncio.to_thread(self.sensor_reader.read_dht11),
+                asyncio.to_thread(self.sensor_reader.read_ina219),
+                asyncio.to_thread(self.sensor_reader.read_ultrasonic),
+            )
+            temp_c, humidity, dht_status = dht_reading
+            voltage, current, power, ina_status = ina_reading
+            distance_cm, ultrasonic_status = ultrasonic_reading
+            temp_f, distance_in = _derive(temp_c, distance_cm)
+            snapshot = SensorSnapshot(
+                temp=temp_c,
+                temp_f=temp_f,
+                humidity=humidity,
+                dht_status=dht_status,
+                voltage=voltage,
+                current=current,
+                power=power,
+                ina_status=ina_status,
+                distance=distance_cm,
+                distance_in=distance_in,
+                ultrasonic_status=ultrasonic_status,
+            )
+            self._latest = snapshot
+            if self._significant_change(snapshot):
+                self._last_flagged = snapshot
+                self._change_event.set()
+            await asyncio.sleep(SENSOR_POLL_INTERVAL)
+
+    def _significant_change(self, snapshot):
+        """True if any field moved beyond its deadband since last flagged"""
+        if self._last_flagged is None:
+            return True
+        for key, new, old in zip(
+            SNAPSHOT_FIELDS, astuple(snapshot), astuple(self._last_flagged)
+        ):
+            if abs(new - old) > DEADBAND.get(key, 0.0):
+                return True
+        return False
+
     async def update_values(self, start_time):
-        """Read sensors and update OPC UA variables"""
-        
-        # Read all sensors
-        temp_c, humidity, dht_status = self.sensor_reader.read_dht11()
-        voltage, current, power, ina_status = self.sensor_reader.read_ina219()
-        distance_cm, ultrasonic_status = self.sensor_reader.read_ultrasonic()
-        
-        # Calculate derived values
-        temp_f = temp_c * 9.0/5.0 + 32.0
-        distance_in = distance_cm / 2.54
+        """Publish the latest sensor snapshot to the OPC UA variables"""
+
+        snapshot = self._latest
+        if snapshot is None:
+            return  # First sensor poll has not completed yet
+
+        # Calculate system values
         uptime = time.time() - start_time
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Update DHT11 values
-        await self.nodes['temp'].write_value(temp_c)
-        await self.nodes['temp_f'].write_value(temp_f)
-        await self.nodes['humidity'].write_value(humidity)
-        await self.nodes['dht_status'].write_value(dht_status)
-        
-        # Update INA219 values
-        await self.nodes['voltage'].write_value(voltage)
-        await self.nodes['current'].write_value(current)
-        await self.nodes['power'].write_value(power)
-        await self.nodes['ina_status'].write_value(ina_status)
-        
-        # Update HC-SR04 values
-        await self.nodes['distance'].write_value(distance_cm)
-        await self.nodes['distance_in'].write_value(distance_in)
-        await self.nodes['ultrasonic_status'].write_value(ultrasonic_status)
-        
-        # Update system info
-        await self.nodes['timestamp'].write_value(timestamp)
-        await self.nodes['uptime'].write_value(uptime)
+        timestamp = datetime.now(timezone.utc)
+
+        # Values in the same order as self._write_plan
+        values = astuple(snapshot) + (timestamp, uptime)
+
+        # Push all changed variables in a single batched WriteRequest
+        # instead of 13 sequential write_value() round-trips. Values
+        # still inside their deadband are skipped entirely - a redundant
+        # write would serialize and notify every subscribed client for
+        # a reading the DHT11's 1 °C / 1 %RH resolution never moved.
+        written_keys = []
+        nodes_to_write = []
+        for (key, nodeid, variant_type), value in zip(self._write_plan, values):
+            if key not in ALWAYS_WRITE:
+                last = self._last_written.get(key)
+                if last is not None and abs(value - last) <= DEADBAND.get(key, 0.0):
+                    continue
+            self._last_written[key] = value
+            written_keys.append(key)
+            nodes_to_write.append(ua.WriteValue(
+                NodeId=nodeid,
+                AttributeId=ua.AttributeIds.Value,
+                Value=ua.DataValue(ua.Variant(value, variant_type)),
+            ))
+
+        if nodes_to_write:
+            results = await self.server.iserver.isession.write(
+                ua.WriteParameters(NodesToWrite=nodes_to_write)
+            )
+            for key, status in zip(written_keys, results):
+                if not status.is_good():
+                    # Forget the cached value so the deadband doesn't
+                    # suppress the retry on the next cycle
+                    self._last_written.pop(key, None)
+                    _logger.error("Write failed for %s: %s", key, status)
         
-        # Log to console
-        _logger.info(f"Updated: Temp={temp_c:.1f}°C, Humidity={humidity:.1f}%, "
-                    f"Voltage={voltage:.2f}V, Current={current:.3f}A, "
-                    f"Distance={distance_cm:.1f}cm")
+        # Log to console - %-style args defer formatting to the handler,
+        # and the level guard skips even the argument packing when INFO
+        # is suppressed
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info("Updated: Temp=%.1f°C, Humidity=%.1f%%, "
+                         "Voltage=%.2fV, Current=%.3fA, Distance=%.1fcm",
+                         snapshot.temp, snapshot.humidity, snapshot.voltage,
+                         snapshot.current, snapshot.distance)
+
+    async def snapshot(self):
+        """Read every sensor variable in one batched ReadRequest
+
+        Returns a dict keyed like self.nodes mapping each variable to
+        its current value. One Read request replaces 13 per-node
+        read_value() calls, so mirroring clients and tests don't repeat
+        the per-node round-trip pattern the write path already avoids.
+        """
+        read_params = ua.ReadParameters(NodesToRead=[
+            ua.ReadValueId(
+                NodeId=nodeid,
+                AttributeId=ua.AttributeIds.Value,
+            )
+            for _key, nodeid, _variant_type in self._write_plan
+        ])
+        results = await self.server.iserver.isession.read(read_params)
+        return {
+            key: data_value.Value.Value
+            for key, data_value in zip(self._write_order, results)
+        }
     
     async def run(self):
         """Start OPC UA server and update loop"""
@@ -342,6 +642,18 @@ class OPCUAServer:
             
             # Start server
             async with self.server:
+                # get_pubsub() only builds the PubSub model - the writer
+                # group tasks are launched by PubSub.start(), so nothing
+                # publishes until it runs. Server.stop() stops it again
+                # on shutdown.
+                if self._pubsub_ready:
+                    try:
+                        await (await self.server.get_pubsub()).start()
+                        _logger.info("✓ OPC UA PubSub publishing started")
+                    except Exception as e:
+                        _logger.error(f"✗ PubSub start failed: {e}",
+                                      exc_info=True)
+
                 _logger.info("=" * 60)
                 _logger.info("OPC UA Server Started Successfully!")
                 _logger.info("=" * 60)
@@ -352,11 +664,37 @@ class OPCUAServer:
                 _logger.info("=" * 60)
                 
                 start_time = time.time()
-                
-                # Main update loop
-                while True:
-                    await self.update_values(start_time)
-                    await asyncio.sleep(UPDATE_INTERVAL)
+                poll_task = asyncio.create_task(self._poll_sensors())
+
+                try:
+                    # Main update loop - wake early on a flagged sensor
+                    # change, or at the next absolute deadline for the
+                    # heartbeat. Scheduling against deadlines instead of
+                    # sleeping UPDATE_INTERVAL after each publish keeps
+                    # the cadence fixed regardless of how long a cycle's
+                    # own work takes, so historians see no drift.
+                    next_deadline = time.monotonic() + UPDATE_INTERVAL
+                    while True:
+                        timeout = next_deadline - time.monotonic()
+                        deadline_due = timeout <= 0
+                        if not deadline_due:
+                            try:
+                                await asyncio.wait_for(
+                                    self._change_event.wait(),
+                                    timeout=timeout,
+                                )
+                            except asyncio.TimeoutError:
+                                deadline_due = True
+                        self._change_event.clear()
+                        await self.update_values(start_time)
+                        if deadline_due:
+                            next_deadline += UPDATE_INTERVAL
+                            if next_deadline <= time.monotonic():
+                                # Fell behind - skip the missed cycles
+                                # rather than bursting to catch up
+                                next_deadline = time.monotonic() + UPDATE_INTERVAL
+                finally:
+                    poll_task.cancel()
                     
         except KeyboardInterrupt:
             _logger.info("\nShutdown requested...")
@@ -375,4 +713,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+        _logger.info("✓ uvloop event loop installed")
     asyncio.run(main())
@@ -170,24 +170,25 @@ try:
             time.sleep(0.00001)  # 10 microseconds
             GPIO.output(TRIG_PIN, False)
             
-            # Measure echo pulse
-            timeout_start = time.time()
+            # Measure echo pulse - monotonic_ns keeps the hot loops on
+            # integer math and is immune to NTP/wall-clock adjustments
+            timeout_start = time.monotonic_ns()
             pulse_start = timeout_start
-            
+
             while GPIO.input(ECHO_PIN) == 0:
-                pulse_start = time.time()
-                if pulse_start - timeout_start > 0.1:  # 100ms timeout
+                pulse_start = time.monotonic_ns()
+                if pulse_start - timeout_start > 100_000_000:  # 100ms timeout
                     raise TimeoutError("No echo received (start)")
-            
+
             pulse_end = pulse_start
             while GPIO.input(ECHO_PIN) == 1:
-                pulse_end = time.time()
-                if pulse_end - pulse_start > 0.1:
+                pulse_end = time.monotonic_ns()
+                if pulse_end - pulse_start > 100_000_000:
                     raise TimeoutError("No echo received (end)")
-            
+
             # Calculate distance
-            pulse_duration = pulse_end - pulse_start
-            distance = pulse_duration * 17150  # Speed of sound / 2
+            pulse_duration_ns = pulse_end - pulse_start
+            distance = pulse_duration_ns * 17150 / 1_000_000_000  # Speed of sound / 2
             distance = round(distance, 2)
             
             # Validate reading